@@ -45,18 +45,20 @@ class MonitorHandler(object):
         Since dbserialize can't handle defaultdicts, we convert to an
         intermediary save format ((obj,fieldname, idstring, callback, kwargs), ...)
 
+        Nothing is written if there are no monitors to save (the stored data is
+        cleared by `restore`, so there is never anything stale to overwrite).
+
         """
         savedata = []
-        if self.monitors:
-            for obj in self.monitors:
-                for fieldname in self.monitors[obj]:
-                    for idstring, (callback, persistent, kwargs) in self.monitors[obj][
-                        fieldname
-                    ].items():
-                        path = "%s.%s" % (callback.__module__, callback.__name__)
-                        savedata.append((obj, fieldname, idstring, path, persistent, kwargs))
-            savedata = dbserialize(savedata)
-            ServerConfig.objects.conf(key=self.savekey, value=savedata)
+        for obj in self.monitors:
+            for fieldname in self.monitors[obj]:
+                for idstring, (callback, persistent, kwargs) in self.monitors[obj][
+                    fieldname
+                ].items():
+                    path = "%s.%s" % (callback.__module__, callback.__name__)
+                    savedata.append((obj, fieldname, idstring, path, persistent, kwargs))
+        if savedata:
+            ServerConfig.objects.conf(key=self.savekey, value=dbserialize(savedata))
 
     def restore(self, server_reload=True):
         """
@@ -186,9 +188,15 @@ class MonitorHandler(object):
                 return
             fieldname = self._attr_category_fieldname("db_value", category)
 
-        idstring_dict = self.monitors[obj][fieldname]
-        if idstring in idstring_dict:
-            del self.monitors[obj][fieldname][idstring]
+        fieldname_dict = self.monitors.get(obj)
+        idstring_dict = fieldname_dict.get(fieldname) if fieldname_dict else None
+        if idstring_dict and idstring in idstring_dict:
+            del idstring_dict[idstring]
+            # don't leave empty entries behind
+            if not idstring_dict:
+                del fieldname_dict[fieldname]
+            if not fieldname_dict:
+                del self.monitors[obj]
 
     def clear(self):
         """
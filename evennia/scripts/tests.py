@@ -229,6 +229,20 @@ class TestMonitorHandler(TestCase):
         self.handler.remove(obj,fieldname,idstring=idstring)
         self.assertEquals(self.handler.monitors[obj][fieldname], {})
 
+    def test_save_skips_empty(self):
+        """Tests that saving without any monitors left doesn't write to the database"""
+        obj = mock.Mock()
+        fieldname = "db_save"
+        callback = dummy_func
+        idstring = "test_save"
+
+        self.handler.add(obj, fieldname, callback, idstring=idstring)
+        self.handler.remove(obj, fieldname, idstring=idstring)
+        self.assertNotIn(obj, self.handler.monitors)
+        with mock.patch("evennia.scripts.monitorhandler.ServerConfig") as mockconf:
+            self.handler.save()
+            mockconf.objects.conf.assert_not_called()
+
     def test_add_with_invalid_function(self):
         obj = mock.Mock()
         """Tests that add method rejects objects where callback is not a function"""
@@ -3,6 +3,8 @@ Custom manager for ServerConfig objects.
 """
 from django.db import models
 
+from evennia.utils.dbserialize import to_pickle
+
 
 class ServerConfigManager(models.Manager):
     """
@@ -51,3 +53,22 @@ class ServerConfigManager(models.Manager):
                 return default
             return conf[0].value
         return None
+
+    def set_runtime(self, value):
+        """
+        Store the server runtime. This is called regularly, so unlike `conf`
+        it updates the value with a single UPDATE query, only creating the
+        config the first time.
+
+        Args:
+            value (float): The server runtime, in seconds.
+
+        """
+        db_value = to_pickle(value)
+        if self.filter(db_key="runtime").update(db_value=db_value):
+            # update() bypasses the idmapper cache, so keep any cached instance in sync
+            for conf in self.model.get_all_cached_instances():
+                if conf.db_key == "runtime":
+                    conf.db_value = db_value
+        else:
+            self.conf("runtime", value)
@@ -29,17 +29,20 @@ evennia._init()
 
 from django.conf import settings
 from django.db import connection
+from django.db.models import Q
 from django.db.utils import OperationalError
 from django.utils.translation import gettext as _
 from evennia.accounts.models import AccountDB
+from evennia.objects.models import ObjectDB
 from evennia.scripts.models import ScriptDB
 from evennia.server.models import ServerConfig
 from evennia.server.sessionhandler import SESSIONS
+from evennia.utils import gametime as _GAMETIME_MODULE
 from evennia.utils import logger
+from evennia.utils.dbserialize import to_pickle
+from evennia.utils.idmapper.models import conditional_flush as _FLUSH_CACHE
 from evennia.utils.utils import get_evennia_version, make_iter, mod_import
 
-_SA = object.__setattr__
-
 # a file with a flag telling the server to restart after shutdown or not.
 SERVER_RESTART = os.path.join(settings.GAME_DIR, "server", "server.restart")
 
@@ -50,6 +53,20 @@ SERVER_STARTSTOP_MODULES = [
     if isinstance(mod, str)
 ]
 
+# the hook functions found in the startstop modules, in module order
+_SERVER_STARTSTOP_HOOKS = {
+    hookname: [getattr(mod, hookname) for mod in SERVER_STARTSTOP_MODULES if hasattr(mod, hookname)]
+    for hookname in (
+        "at_server_init",
+        "at_server_start",
+        "at_server_stop",
+        "at_server_reload_start",
+        "at_server_reload_stop",
+        "at_server_cold_start",
+        "at_server_cold_stop",
+    )
+}
+
 # modules containing plugin services
 SERVER_SERVICES_PLUGIN_MODULES = make_iter(settings.SERVER_SERVICES_PLUGIN_MODULES)
 
@@ -105,31 +122,70 @@ _IDLE_TIMEOUT = settings.IDLE_TIMEOUT
 _LAST_SERVER_TIME_SNAPSHOT = 0
 
 _MAINTENANCE_COUNT = 0
-_FLUSH_CACHE = None
-_GAMETIME_MODULE = None
-_OBJECTDB = None
+# how often (in maintenance ticks) to check for link-dead puppets
+_PUPPET_CHECK_INTERVAL = 30
+# how often (in maintenance ticks) to store the server runtime to the database
+_RUNTIME_SAVE_INTERVAL = 5
+# sqlite3 connections don't time out, so there's no need to check them
+_DB_CONNECTION_CHECK = "sqlite3" not in settings.DATABASES.get("default", {}).get("ENGINE", "")
+
+# how long (in seconds) to remember the result of the noidletimeout lock check
+_NOIDLETIMEOUT_CACHE_TTL = 300
+# {account_id: (expiry_time, access_result)}
+_NOIDLETIMEOUT_CACHE = {}
+
+# how long (in seconds) to wait for pending web requests when shutting down
+_SHUTDOWN_WEB_REQUEST_TIMEOUT = 10
+
+
+def _noidletimeout_access(account, now, access_cache):
+    """
+    Check if an account passes the `noidletimeout` lock. The result is cached
+    for a short time to avoid re-checking the lock of idling accounts every
+    maintenance tick.
+
+    Args:
+        account (Account): The account to check.
+        now (float): The current time.
+        access_cache (dict): The cache to fill for the next tick.
 
+    Returns:
+        bool: If the account is exempt from idle timeouts.
 
-def _server_maintenance():
+    """
+    key = account.id
+    cached = access_cache.get(key) or _NOIDLETIMEOUT_CACHE.get(key)
+    if not cached or cached[0] < now:
+        cached = (
+            now + _NOIDLETIMEOUT_CACHE_TTL,
+            account.access(account, "noidletimeout", default=False),
+        )
+    access_cache[key] = cached
+    return cached[1]
+
+
+def _server_maintenance(count=1):
     """
     This maintenance function handles repeated checks and updates that
     the server needs to do. It is called every minute.
+
+    Args:
+        count (int, optional): The number of minute-intervals that passed since
+            the last call, as reported by `LoopingCall.withCount`. This is larger
+            than 1 if calls were missed (such as when the reactor was busy).
+
     """
-    global EVENNIA, _MAINTENANCE_COUNT, _FLUSH_CACHE, _GAMETIME_MODULE
-    global _LAST_SERVER_TIME_SNAPSHOT
-    global _OBJECTDB
+    global _MAINTENANCE_COUNT, _LAST_SERVER_TIME_SNAPSHOT
 
-    if not _OBJECTDB:
-        from evennia.objects.models import ObjectDB as _OBJECTDB
-    if not _GAMETIME_MODULE:
-        from evennia.utils import gametime as _GAMETIME_MODULE
-    if not _FLUSH_CACHE:
-        from evennia.utils.idmapper.models import conditional_flush as _FLUSH_CACHE
+    prev_count = _MAINTENANCE_COUNT
+    _MAINTENANCE_COUNT += count
 
-    _MAINTENANCE_COUNT += 1
+    def _due(interval):
+        # if we passed a multiple of interval since the last call
+        return _MAINTENANCE_COUNT // interval > prev_count // interval
 
     now = time.time()
-    if _MAINTENANCE_COUNT == 1:
+    if prev_count == 0:
         # first call after a reload
         _GAMETIME_MODULE.SERVER_START_TIME = now
         _GAMETIME_MODULE.SERVER_RUNTIME = ServerConfig.objects.conf("runtime", default=0.0)
@@ -140,39 +196,41 @@ def _server_maintenance():
         _GAMETIME_MODULE.SERVER_RUNTIME += now - _LAST_SERVER_TIME_SNAPSHOT
     _LAST_SERVER_TIME_SNAPSHOT = now
 
-    # update game time and save it across reloads
+    # update game time. It's saved across reloads by shutdown(), so we only
+    # need to store it to the database occasionally, in case of a crash.
     _GAMETIME_MODULE.SERVER_RUNTIME_LAST_UPDATED = now
-    ServerConfig.objects.conf("runtime", _GAMETIME_MODULE.SERVER_RUNTIME)
+    if _due(_RUNTIME_SAVE_INTERVAL):
+        ServerConfig.objects.set_runtime(_GAMETIME_MODULE.SERVER_RUNTIME)
 
-    if _MAINTENANCE_COUNT % 5 == 0:
+    if _due(5):
         # check cache size every 5 minutes
         _FLUSH_CACHE(_IDMAPPER_CACHE_MAXSIZE)
-    if _MAINTENANCE_COUNT % (60 * 7) == 0:
-        # drop database connection every 7 hrs to avoid default timeouts on MySQL
-        # (see https://github.com/evennia/evennia/issues/1376)
-        connection.close()
+    if _DB_CONNECTION_CHECK:
+        # the server's own db connection is not handled by Django's request cycle,
+        # so we make sure to apply CONN_MAX_AGE and CONN_HEALTH_CHECKS to it here.
+        # This avoids database timeouts on e.g. MySQL
+        # (see https://github.com/evennia/evennia/issues/1376).
+        connection.close_if_unusable_or_obsolete()
 
     # handle idle timeouts
     if _IDLE_TIMEOUT > 0:
         reason = _("idle timeout exceeded")
-        to_disconnect = []
-        for session in (
-            sess for sess in SESSIONS.values() if (now - sess.cmd_last) > _IDLE_TIMEOUT
-        ):
-            if not session.account or not session.account.access(
-                session.account, "noidletimeout", default=False
-            ):
-                to_disconnect.append(session)
-
-        for session in to_disconnect:
-            SESSIONS.disconnect(session, reason=reason)
+        access_cache = {}
+        # get_idle_sessions returns a new list, so it's safe to disconnect while looping
+        for session in SESSIONS.get_idle_sessions(_IDLE_TIMEOUT, now=now):
+            account = session.account
+            if not account or not _noidletimeout_access(account, now, access_cache):
+                SESSIONS.disconnect(session, reason=reason)
+        _NOIDLETIMEOUT_CACHE.clear()
+        _NOIDLETIMEOUT_CACHE.update(access_cache)
 
     # run unpuppet hooks for objects that are marked as being puppeted,
     # but which lacks an account (indicates a broken unpuppet operation
-    # such as a server crash)
-    if _MAINTENANCE_COUNT > 1:
+    # such as a server crash). This is mainly needed right after startup,
+    # so we only check once after a reload and then only occasionally.
+    if prev_count == 1 or _due(_PUPPET_CHECK_INTERVAL):
         unpuppet_count = 0
-        for obj in _OBJECTDB.objects.get_by_tag(key="puppeted", category="account"):
+        for obj in ObjectDB.objects.get_by_tag(key="puppeted", category="account"):
             if not obj.has_account:
                 obj.at_pre_unpuppet()
                 obj.at_post_unpuppet(None, reason=_(" (connection lost)"))
@@ -215,6 +273,7 @@ class Evennia:
 
         # Database-specific startup optimizations.
         self.sqlite3_prep()
+        self.db_connection_prep()
 
         self.start_time = time.time()
 
@@ -224,14 +283,25 @@ class Evennia:
         # (see https://github.com/evennia/evennia/issues/1128)
         def _wrap_sigint_handler(*args):
             from twisted.internet.defer import Deferred
+            from twisted.internet.task import deferLater
 
             if hasattr(self, "web_root"):
+                # this fires by itself once all pending web requests are done (or
+                # right away if there are none), so we only cap the waiting time
                 d = self.web_root.empty_threadpool()
-                d.addCallback(lambda _: self.shutdown("reload", _reactor_stopping=True))
+                d.addTimeout(_SHUTDOWN_WEB_REQUEST_TIMEOUT, reactor)
+                # shut down on a later reactor iteration, outside of the signal handler
+                d.addBoth(
+                    lambda _: deferLater(
+                        reactor, 0, self.shutdown, "reload", _reactor_stopping=True
+                    )
+                )
+                d.addCallback(lambda _: reactor.stop())
             else:
                 d = Deferred(lambda _: self.shutdown("reload", _reactor_stopping=True))
-            d.addCallback(lambda _: reactor.stop())
-            reactor.callLater(1, d.callback, None)
+                d.addCallback(lambda _: reactor.stop())
+                # start on the next reactor iteration, outside of the signal handler
+                reactor.callLater(0, d.callback, None)
 
         reactor.sigInt = _wrap_sigint_handler
 
@@ -242,20 +312,39 @@ class Evennia:
         Optimize some SQLite stuff at startup since we
         can't save it to the database.
         """
-        if (
-            ".".join(str(i) for i in django.VERSION) < "1.2"
-            and settings.DATABASES.get("default", {}).get("ENGINE") == "sqlite3"
-        ) or (
-            hasattr(settings, "DATABASES")
-            and settings.DATABASES.get("default", {}).get("ENGINE", None)
-            == "django.db.backends.sqlite3"
-        ):
+        engine = settings.DATABASES.get("default", {}).get("ENGINE")
+        if engine in ("sqlite3", "django.db.backends.sqlite3"):
             cursor = connection.cursor()
             cursor.execute("PRAGMA cache_size=10000")
             cursor.execute("PRAGMA synchronous=OFF")
             cursor.execute("PRAGMA count_changes=OFF")
             cursor.execute("PRAGMA temp_store=2")
 
+    def db_connection_prep(self):
+        """
+        Make sure connections to network databases (like MySQL or PostgreSQL)
+        are reused instead of being re-opened for every request. This uses
+        `settings.CONN_MAX_AGE` for databases that don't set their own and
+        turns on `CONN_HEALTH_CHECKS` so dead connections are re-opened.
+        """
+        for alias, dbconf in settings.DATABASES.items():
+            if "sqlite3" in dbconf.get("ENGINE", ""):
+                continue
+            if dbconf.get("CONN_MAX_AGE", 0) == 0 and settings.CONN_MAX_AGE:
+                logger.log_warn(
+                    f"DATABASES['{alias}'] has no CONN_MAX_AGE set - database connections "
+                    f"will not be reused between requests. Using CONN_MAX_AGE="
+                    f"{settings.CONN_MAX_AGE} instead."
+                )
+                dbconf["CONN_MAX_AGE"] = settings.CONN_MAX_AGE
+            if not dbconf.get("CONN_HEALTH_CHECKS"):
+                logger.log_warn(
+                    f"DATABASES['{alias}'] has CONN_HEALTH_CHECKS disabled - connections "
+                    "that timed out (such as after MySQL's wait_timeout) will not be "
+                    "re-opened automatically. Enabling CONN_HEALTH_CHECKS."
+                )
+                dbconf["CONN_HEALTH_CHECKS"] = True
+
     def update_defaults(self):
         """
         We make sure to store the most important object defaults here, so
@@ -280,12 +369,12 @@ class Evennia:
             "BASE_CHANNEL_TYPECLASS",
         )
         # get previous and current settings so they can be compared
-        settings_compare = list(
-            zip(
-                [ServerConfig.objects.conf(name) for name in settings_names],
-                [settings.__getattr__(name) for name in settings_names],
-            )
-        )
+        prev_settings = {
+            conf.key: conf.value for conf in ServerConfig.objects.filter(db_key__in=settings_names)
+        }
+        settings_compare = [
+            (prev_settings.get(name), settings.__getattr__(name)) for name in settings_names
+        ]
         mismatches = [
             i for i, tup in enumerate(settings_compare) if tup[0] and tup[1] and tup[0] != tup[1]
         ]
@@ -295,9 +384,8 @@ class Evennia:
             # we have a changed default. Import relevant objects and
             # run the update
             from evennia.comms.models import ChannelDB
-            from evennia.objects.models import ObjectDB
 
-            # from evennia.accounts.models import AccountDB
+            to_flush = set()
             for i, prev, curr in (
                 (i, tup[0], tup[1]) for i, tup in enumerate(settings_compare) if i in mismatches
             ):
@@ -313,39 +401,46 @@ class Evennia:
                     ObjectDB.objects.filter(db_cmdset_storage__exact=prev).update(
                         db_cmdset_storage=curr
                     )
+                    to_flush.add(ObjectDB)
                 if i == 1:
                     AccountDB.objects.filter(db_cmdset_storage__exact=prev).update(
                         db_cmdset_storage=curr
                     )
+                    to_flush.add(AccountDB)
                 if i == 2:
                     AccountDB.objects.filter(db_typeclass_path__exact=prev).update(
                         db_typeclass_path=curr
                     )
+                    to_flush.add(AccountDB)
                 if i in (3, 4, 5, 6):
                     ObjectDB.objects.filter(db_typeclass_path__exact=prev).update(
                         db_typeclass_path=curr
                     )
+                    to_flush.add(ObjectDB)
                 if i == 7:
                     ScriptDB.objects.filter(db_typeclass_path__exact=prev).update(
                         db_typeclass_path=curr
                     )
+                    to_flush.add(ScriptDB)
                 if i == 8:
                     ChannelDB.objects.filter(db_typeclass_path__exact=prev).update(
                         db_typeclass_path=curr
                     )
-                # store the new default and clean caches
+                    to_flush.add(ChannelDB)
+                # store the new default
                 ServerConfig.objects.conf(settings_names[i], curr)
-                ObjectDB.flush_instance_cache()
-                AccountDB.flush_instance_cache()
-                ScriptDB.flush_instance_cache()
-                ChannelDB.flush_instance_cache()
+            # clean the caches of the models we changed, once each
+            for dbmodel in to_flush:
+                dbmodel.flush_instance_cache()
         # if this is the first start we might not have a "previous"
         # setup saved. Store it now.
-        [
-            ServerConfig.objects.conf(settings_names[i], tup[1])
+        missing = [
+            ServerConfig(db_key=settings_names[i], db_value=to_pickle(tup[1]))
             for i, tup in enumerate(settings_compare)
             if not tup[0]
         ]
+        if missing:
+            ServerConfig.objects.bulk_create(missing, ignore_conflicts=True)
 
     def run_initial_setup(self):
         """
@@ -357,15 +452,18 @@ class Evennia:
 
         """
         global INFO_DICT
-        initial_setup = importlib.import_module(settings.INITIAL_SETUP_MODULE)
         last_initial_setup_step = ServerConfig.objects.conf("last_initial_setup_step")
+        if last_initial_setup_step in ("done", -1):
+            # setup is already finished, no need to import the setup module
+            return
+        initial_setup = importlib.import_module(settings.INITIAL_SETUP_MODULE)
         try:
             if not last_initial_setup_step:
                 # None is only returned if the config does not exist,
                 # i.e. this is an empty DB that needs populating.
                 INFO_DICT["info"] = " Server started for the first time. Setting defaults."
                 initial_setup.handle_setup()
-            elif last_initial_setup_step not in ("done", -1):
+            else:
                 # last step crashed, so we weill resume from this step.
                 # modules and setup will resume from this step, retrying
                 # the last failed module. When all are finished, the step
@@ -386,28 +484,45 @@ class Evennia:
 
         """
 
-        from evennia.accounts.models import AccountDB
         from evennia.comms.models import ChannelDB
         from evennia.utils.create import create_channel
 
         superuser = AccountDB.objects.get(id=1)
 
-        # mudinfo
         mudinfo_chan = settings.CHANNEL_MUDINFO
-        if mudinfo_chan and not ChannelDB.objects.filter(db_key__iexact=mudinfo_chan["key"]):
+        connectinfo_chan = settings.CHANNEL_CONNECTINFO
+
+        # find which of the channels already exist, in one query
+        wanted = [
+            chan_info["key"]
+            for chan_info in [mudinfo_chan, connectinfo_chan, *settings.DEFAULT_CHANNELS]
+            if chan_info
+        ]
+        existing = set()
+        if wanted:
+            query = Q()
+            for key in wanted:
+                query |= Q(db_key__iexact=key)
+            existing = {
+                key.lower()
+                for key in ChannelDB.objects.filter(query).values_list("db_key", flat=True)
+            }
+
+        # mudinfo
+        if mudinfo_chan and mudinfo_chan["key"].lower() not in existing:
             channel = create_channel(**mudinfo_chan)
             channel.connect(superuser)
+            existing.add(mudinfo_chan["key"].lower())
         # connectinfo
-        connectinfo_chan = settings.CHANNEL_CONNECTINFO
-        if connectinfo_chan and not ChannelDB.objects.filter(
-            db_key__iexact=connectinfo_chan["key"]
-        ):
+        if connectinfo_chan and connectinfo_chan["key"].lower() not in existing:
             channel = create_channel(**connectinfo_chan)
+            existing.add(connectinfo_chan["key"].lower())
         # default channels
         for chan_info in settings.DEFAULT_CHANNELS:
-            if not ChannelDB.objects.filter(db_key__iexact=chan_info["key"]):
+            if chan_info["key"].lower() not in existing:
                 channel = create_channel(**chan_info)
                 channel.connect(superuser)
+                existing.add(chan_info["key"].lower())
 
     def run_init_hooks(self, mode):
         """
@@ -420,17 +535,16 @@ class Evennia:
         from evennia.typeclasses.models import TypedObject
 
         # start server time and maintenance task
-        self.maintenance_task = LoopingCall(_server_maintenance)
+        self.maintenance_task = LoopingCall.withCount(_server_maintenance)
         self.maintenance_task.start(60, now=True)  # call every minute
 
         # update eventual changed defaults
         self.update_defaults()
 
         # run at_init() on all cached entities on reconnect
-        [
-            [entity.at_init() for entity in typeclass_db.get_all_cached_instances()]
-            for typeclass_db in TypedObject.__subclasses__()
-        ]
+        for typeclass_db in TypedObject.__subclasses__():
+            for entity in typeclass_db.get_all_cached_instances():
+                entity.at_init()
 
         self.at_server_init()
 
@@ -443,8 +557,6 @@ class Evennia:
             self.at_server_cold_start()
             logger.log_msg("Evennia Server successfully restarted in 'reset' mode.")
         elif mode == "shutdown":
-            from evennia.objects.models import ObjectDB
-
             self.at_server_cold_start()
             # clear eventual lingering session storages
             ObjectDB.objects.clear_all_sessids()
@@ -475,20 +587,18 @@ class Evennia:
             # once; we don't need to run the shutdown procedure again.
             defer.returnValue(None)
 
-        from evennia.objects.models import ObjectDB
-        from evennia.server.models import ServerConfig
-        from evennia.utils import gametime as _GAMETIME_MODULE
-
         if mode == "reload":
             # call restart hooks
             ServerConfig.objects.conf("server_restart_mode", "reload")
-            yield [o.at_server_reload() for o in ObjectDB.get_all_cached_instances()]
-            yield [p.at_server_reload() for p in AccountDB.get_all_cached_instances()]
-            yield [
-                (s._pause_task(auto_pause=True) if s.is_active else None, s.at_server_reload())
-                for s in ScriptDB.get_all_cached_instances()
-                if s.id
-            ]
+            for obj in ObjectDB.get_all_cached_instances():
+                obj.at_server_reload()
+            for account in AccountDB.get_all_cached_instances():
+                account.at_server_reload()
+            for script in ScriptDB.get_all_cached_instances():
+                if script.id:
+                    if script.is_active:
+                        script._pause_task(auto_pause=True)
+                    script.at_server_reload()
             yield self.sessions.all_sessions_portal_sync()
             self.at_server_reload_stop()
             # only save monitor state on reload, not on shutdown/reset
@@ -498,23 +608,28 @@ class Evennia:
         else:
             if mode == "reset":
                 # like shutdown but don't unset the is_connected flag and don't disconnect sessions
-                yield [o.at_server_shutdown() for o in ObjectDB.get_all_cached_instances()]
-                yield [p.at_server_shutdown() for p in AccountDB.get_all_cached_instances()]
+                for obj in ObjectDB.get_all_cached_instances():
+                    obj.at_server_shutdown()
+                for account in AccountDB.get_all_cached_instances():
+                    account.at_server_shutdown()
                 if self.amp_protocol:
                     yield self.sessions.all_sessions_portal_sync()
             else:  # shutdown
-                yield [_SA(p, "is_connected", False) for p in AccountDB.get_all_cached_instances()]
-                yield [o.at_server_shutdown() for o in ObjectDB.get_all_cached_instances()]
-                yield [
-                    (p.unpuppet_all(), p.at_server_shutdown())
-                    for p in AccountDB.get_all_cached_instances()
-                ]
+                # unset is_connected for all accounts in one query, then update
+                # the cached instances without saving them again
+                AccountDB.objects.filter(db_is_connected=True).update(db_is_connected=False)
+                for account in AccountDB.get_all_cached_instances():
+                    account.db_is_connected = False
+                for obj in ObjectDB.get_all_cached_instances():
+                    obj.at_server_shutdown()
+                for account in AccountDB.get_all_cached_instances():
+                    account.unpuppet_all()
+                    account.at_server_shutdown()
                 yield ObjectDB.objects.clear_all_sessids()
-            yield [
-                (s._pause_task(auto_pause=True), s.at_server_shutdown())
-                for s in ScriptDB.get_all_cached_instances()
-                if s.id and s.is_active
-            ]
+            for script in ScriptDB.get_all_cached_instances():
+                if script.id and script.is_active:
+                    script._pause_task(auto_pause=True)
+                    script.at_server_shutdown()
             ServerConfig.objects.conf("server_restart_mode", "reset")
             self.at_server_cold_stop()
 
@@ -535,7 +650,7 @@ class Evennia:
             reactor.callLater(1, reactor.stop)
 
         # we make sure the proper gametime is saved as late as possible
-        ServerConfig.objects.conf("runtime", _GAMETIME_MODULE.runtime())
+        ServerConfig.objects.set_runtime(_GAMETIME_MODULE.runtime())
 
     def get_info_dict(self):
         """
@@ -550,9 +665,8 @@ class Evennia:
         """
         This is called first when the server is starting, before any other hooks, regardless of how it's starting.
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_init"):
-                mod.at_server_init()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_init"]:
+            hook()
 
     def at_server_start(self):
         """
@@ -560,9 +674,8 @@ class Evennia:
         how it was shut down.
 
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_start"):
-                mod.at_server_start()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_start"]:
+            hook()
 
     def at_server_stop(self):
         """
@@ -570,18 +683,16 @@ class Evennia:
         of it is fore a reload, reset or shutdown.
 
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_stop"):
-                mod.at_server_stop()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_stop"]:
+            hook()
 
     def at_server_reload_start(self):
         """
         This is called only when server starts back up after a reload.
 
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_reload_start"):
-                mod.at_server_reload_start()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_reload_start"]:
+            hook()
 
     def at_post_portal_sync(self, mode):
         """
@@ -621,9 +732,8 @@ class Evennia:
         This is called only time the server stops before a reload.
 
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_reload_stop"):
-                mod.at_server_reload_stop()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_reload_stop"]:
+            hook()
 
     def at_server_cold_start(self):
         """
@@ -633,13 +743,9 @@ class Evennia:
         """
         # We need to do this just in case the server was killed in a way where
         # the normal cleanup operations did not have time to run.
-        from evennia.objects.models import ObjectDB
-
         ObjectDB.objects.clear_all_sessids()
 
         # Remove non-persistent scripts
-        from evennia.scripts.models import ScriptDB
-
         for script in ScriptDB.objects.filter(db_persistent=False):
             script._stop_task()
 
@@ -651,18 +757,16 @@ class Evennia:
                     if character:
                         character.delete()
                 guest.delete()
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_cold_start"):
-                mod.at_server_cold_start()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_cold_start"]:
+            hook()
 
     def at_server_cold_stop(self):
         """
         This is called only when the server goes down due to a shutdown or reset.
 
         """
-        for mod in SERVER_STARTSTOP_MODULES:
-            if hasattr(mod, "at_server_cold_stop"):
-                mod.at_server_cold_stop()
+        for hook in _SERVER_STARTSTOP_HOOKS["at_server_cold_stop"]:
+            hook()
 
 
 # ------------------------------------------------------------
@@ -684,8 +788,14 @@ except OperationalError:
 application = service.Application("Evennia")
 
 
-if "--nodaemon" not in sys.argv and "test" not in sys.argv:
-    # activate logging for interactive/testing mode
+if (
+    "--nodaemon" not in sys.argv
+    and "test" not in sys.argv
+    and not os.environ.get("EVENNIA_NO_LOGFILE")
+):
+    # activate logging for interactive/testing mode. Setting the
+    # EVENNIA_NO_LOGFILE environment variable skips the log file, such
+    # as for ephemeral CI runs.
     logfile = logger.WeeklyLogFile(
         os.path.basename(settings.SERVER_LOG_FILE),
         os.path.dirname(settings.SERVER_LOG_FILE),
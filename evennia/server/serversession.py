@@ -228,6 +228,11 @@ class ServerSession(_BASE_SESSION_CLASS):
             # Account-visible idle time, not used in idle timeout calcs.
             self.cmd_last_visible = self.cmd_last
 
+        # re-sort us in the sessionhandler's idle-timeout index
+        sessionhandler = getattr(self, "sessionhandler", None)
+        if sessionhandler is not None:
+            sessionhandler.update_idle_index(self)
+
     def update_flags(self, **kwargs):
         """
         Update the protocol_flags and sync them with Portal.
@@ -13,6 +13,7 @@ There are two similar but separate stores of sessions:
 
 """
 import time
+from bisect import bisect_left, insort
 from codecs import decode as codecs_decode
 
 from django.conf import settings
@@ -310,6 +311,73 @@ class ServerSessionHandler(SessionHandler):
         self.server_data = {"servername": _SERVERNAME}
         # will be set on psync
         self.portal_start_time = 0.0
+        # sorted (cmd_last, sessid) tuples, used for finding idle sessions
+        # without having to scan every session. _idle_keys maps sessid to the
+        # cmd_last value currently stored in the index.
+        self._idle_index = []
+        self._idle_keys = {}
+
+    def __setitem__(self, key, value):
+        """
+        Add the session to the idle index as it's stored.
+
+        """
+        super().__setitem__(key, value)
+        if key is not None:
+            self.update_idle_index(value)
+
+    def __delitem__(self, key):
+        """
+        Remove the session from the idle index as it's deleted.
+
+        """
+        super().__delitem__(key)
+        self._idle_index_remove(key)
+
+    def _idle_index_remove(self, sessid):
+        """
+        Remove a sessid from the idle index, if it's there.
+
+        """
+        cmd_last = self._idle_keys.pop(sessid, None)
+        if cmd_last is not None:
+            entry = (cmd_last, sessid)
+            ind = bisect_left(self._idle_index, entry)
+            if ind < len(self._idle_index) and self._idle_index[ind] == entry:
+                del self._idle_index[ind]
+
+    def update_idle_index(self, session):
+        """
+        Re-sort a session in the idle index. This should be called whenever
+        the session's `cmd_last` changes.
+
+        Args:
+            session (Session): The session to update.
+
+        """
+        sessid = session.sessid
+        self._idle_index_remove(sessid)
+        if sessid in self:
+            cmd_last = session.cmd_last
+            insort(self._idle_index, (cmd_last, sessid))
+            self._idle_keys[sessid] = cmd_last
+
+    def get_idle_sessions(self, idle_timeout, now=None):
+        """
+        Get all sessions that have not been active for longer than a given time.
+
+        Args:
+            idle_timeout (int or float): The idle time, in seconds.
+            now (float, optional): The current time. If not given, this will be
+                taken from `time.time()`.
+
+        Returns:
+            list: The idle sessions, with the longest-idle session first.
+
+        """
+        now = time.time() if now is None else now
+        ind = bisect_left(self._idle_index, (now - idle_timeout,))
+        return [self[sessid] for _, sessid in self._idle_index[:ind] if sessid in self]
 
     def _run_cmd_login(self, session):
         """
@@ -379,6 +447,7 @@ class ServerSessionHandler(SessionHandler):
             # ones which should only be changed from portal (like
             # protocol_flags etc)
             session.load_sync_data(portalsessiondata)
+            self.update_idle_index(session)
 
     def portal_sessions_sync(self, portalsessionsdata):
         """
@@ -8,7 +8,10 @@ import unittest
 
 from django.test import TestCase
 from django.test.runner import DiscoverRunner
+from mock import MagicMock
 
+from evennia.server.models import ServerConfig
+from evennia.server.sessionhandler import ServerSessionHandler
 from evennia.server.throttle import Throttle
 from evennia.server.validators import EvenniaPasswordValidator
 from evennia.utils.test_resources import BaseEvenniaTest
@@ -134,3 +137,50 @@ class ThrottleTest(BaseEvenniaTest):
 
         # Make sure the cache is empty
         self.assertFalse(throttle.get())
+
+
+class ServerConfigTest(TestCase):
+    """
+    Test the ServerConfig manager.
+    """
+
+    def test_set_runtime(self):
+        ServerConfig.objects.conf("runtime", delete=True)
+        ServerConfig.objects.set_runtime(10.5)
+        self.assertEqual(ServerConfig.objects.conf("runtime"), 10.5)
+        ServerConfig.objects.set_runtime(20.0)
+        self.assertEqual(ServerConfig.objects.conf("runtime"), 20.0)
+        self.assertEqual(ServerConfig.objects.filter(db_key="runtime").count(), 1)
+
+
+class TestIdleIndex(unittest.TestCase):
+    """
+    Test the sessionhandler's index of idle sessions.
+    """
+
+    def _session(self, sessid, cmd_last):
+        session = MagicMock()
+        session.sessid = sessid
+        session.cmd_last = cmd_last
+        return session
+
+    def test_get_idle_sessions(self):
+        handler = ServerSessionHandler()
+        sess1 = self._session(1, 100)
+        sess2 = self._session(2, 900)
+        sess3 = self._session(3, 50)
+        for sess in (sess1, sess2, sess3):
+            handler[sess.sessid] = sess
+
+        self.assertEqual(handler.get_idle_sessions(10, now=1000), [sess3, sess1, sess2])
+        self.assertEqual(handler.get_idle_sessions(500, now=1000), [sess3, sess1])
+
+        # activity re-sorts the session
+        sess1.cmd_last = 995
+        handler.update_idle_index(sess1)
+        self.assertEqual(handler.get_idle_sessions(10, now=1000), [sess3, sess2])
+
+        # deleted sessions are removed from the index
+        del handler[3]
+        self.assertEqual(handler.get_idle_sessions(10, now=1000), [sess2])
+        self.assertEqual(len(handler._idle_index), 2)
@@ -7,6 +7,8 @@ from unittest import TestCase
 
 from django.test import override_settings
 from mock import DEFAULT, MagicMock, call, patch
+from twisted.internet.defer import Deferred, succeed
+from twisted.internet.task import Clock
 
 
 @patch("evennia.server.server.LoopingCall", new=MagicMock())
@@ -35,9 +37,10 @@ class TestServer(TestCase):
             mocks["connection"].close = MagicMock()
             mocks["ServerConfig"].objects.conf = MagicMock(return_value=456)
 
-            # flush cache
+            # first call after a reload only loads the runtime
             self.server._server_maintenance()
-            mocks["ServerConfig"].objects.conf.assert_called_with("runtime", 456)
+            mocks["ServerConfig"].objects.conf.assert_called_once_with("runtime", default=0.0)
+            self.assertEqual(self.server._GAMETIME_MODULE.SERVER_RUNTIME, 456)
 
     def test__server_maintenance_flush(self):
         with patch.multiple(
@@ -56,6 +59,8 @@ class TestServer(TestCase):
             # flush cache
             self.server._server_maintenance()
             mocks["_FLUSH_CACHE"].assert_called_with(1000)
+            # runtime is saved on the same interval
+            mocks["ServerConfig"].objects.set_runtime.assert_called()
 
     def test__server_maintenance_close_connection(self):
         with patch.multiple(
@@ -65,14 +70,32 @@ class TestServer(TestCase):
             _FLUSH_CACHE=DEFAULT,
             connection=DEFAULT,
             _IDMAPPER_CACHE_MAXSIZE=1000,
-            _MAINTENANCE_COUNT=(60 * 7) - 1,
+            _MAINTENANCE_COUNT=1,
             _LAST_SERVER_TIME_SNAPSHOT=0,
+            _DB_CONNECTION_CHECK=True,
             ServerConfig=DEFAULT,
         ) as mocks:
-            mocks["connection"].close = MagicMock()
+            mocks["connection"].close_if_unusable_or_obsolete = MagicMock()
             mocks["ServerConfig"].objects.conf = MagicMock(return_value=100)
             self.server._server_maintenance()
-            mocks["connection"].close.assert_called()
+            mocks["connection"].close_if_unusable_or_obsolete.assert_called()
+
+    def test__server_maintenance_missed_ticks(self):
+        with patch.multiple(
+            "evennia.server.server",
+            LoopingCall=DEFAULT,
+            Evennia=DEFAULT,
+            _FLUSH_CACHE=DEFAULT,
+            connection=DEFAULT,
+            _IDMAPPER_CACHE_MAXSIZE=1000,
+            _MAINTENANCE_COUNT=3,
+            _IDLE_TIMEOUT=0,
+            ServerConfig=DEFAULT,
+        ) as mocks:
+            # two missed ticks passes the 5-minute mark
+            self.server._server_maintenance(3)
+            mocks["_FLUSH_CACHE"].assert_called_with(1000)
+            self.assertEqual(self.server._MAINTENANCE_COUNT, 6)
 
     def test__server_maintenance_idle_time(self):
         with patch.multiple(
@@ -86,6 +109,7 @@ class TestServer(TestCase):
             _LAST_SERVER_TIME_SNAPSHOT=0,
             SESSIONS=DEFAULT,
             _IDLE_TIMEOUT=10,
+            _NOIDLETIMEOUT_CACHE={},
             time=DEFAULT,
             ServerConfig=DEFAULT,
         ) as mocks:
@@ -106,13 +130,15 @@ class TestServer(TestCase):
             mocks["time"].time = MagicMock(return_value=1000)
 
             mocks["ServerConfig"].objects.conf = MagicMock(return_value=100)
-            mocks["SESSIONS"].values = MagicMock(return_value=[sess1, sess2, sess3, sess4])
+            mocks["SESSIONS"].get_idle_sessions = MagicMock(return_value=[sess1, sess3, sess4])
             mocks["SESSIONS"].disconnect = MagicMock()
 
             self.server._server_maintenance()
+            mocks["SESSIONS"].get_idle_sessions.assert_called_with(10, now=1000)
             reason = "idle timeout exceeded"
             calls = [call(sess1, reason=reason), call(sess4, reason=reason)]
             mocks["SESSIONS"].disconnect.assert_has_calls(calls, any_order=True)
+            self.assertEqual(mocks["SESSIONS"].disconnect.call_count, 2)
 
     def test_evennia_start(self):
         with patch.multiple("evennia.server.server", time=DEFAULT, service=DEFAULT) as mocks:
@@ -121,7 +147,7 @@ class TestServer(TestCase):
             evennia = self.server.Evennia(MagicMock())
             self.assertEqual(evennia.start_time, 1000)
 
-    @patch("evennia.objects.models.ObjectDB")
+    @patch("evennia.server.server.ObjectDB")
     @patch("evennia.server.server.AccountDB")
     @patch("evennia.server.server.ScriptDB")
     @patch("evennia.comms.models.ChannelDB")
@@ -145,12 +171,14 @@ class TestServer(TestCase):
                 "BASE_SCRIPT_TYPECLASS",
                 "BASE_CHANNEL_TYPECLASS",
             )
-            fakes = {name: "Dummy.path" for name in settings_names}
+            fakes = []
+            for name in settings_names:
+                fake = MagicMock()
+                fake.key = name
+                fake.value = "Dummy.path"
+                fakes.append(fake)
 
-            def _mock_conf(key, *args):
-                return fakes[key]
-
-            mocks["ServerConfig"].objects.conf = _mock_conf
+            mocks["ServerConfig"].objects.filter = MagicMock(return_value=fakes)
 
             evennia = self.server.Evennia(MagicMock())
             evennia.update_defaults()
@@ -159,6 +187,14 @@ class TestServer(TestCase):
             mockscript.objects.filter.assert_called()
             mockacct.objects.filter.assert_called()
             mockobj.objects.filter.assert_called()
+            # each changed model's cache is only flushed once
+            mockchan.flush_instance_cache.assert_called_once()
+            mockscript.flush_instance_cache.assert_called_once()
+            mockacct.flush_instance_cache.assert_called_once()
+            mockobj.flush_instance_cache.assert_called_once()
+            # all previous defaults are read in one query and none are missing
+            mocks["ServerConfig"].objects.filter.assert_called_once()
+            mocks["ServerConfig"].objects.bulk_create.assert_not_called()
 
     def test_initial_setup(self):
         from evennia.utils.create import create_account
@@ -191,6 +227,73 @@ class TestServer(TestCase):
             evennia.run_initial_setup()
         acct.delete()
 
+    def test_initial_setup_done(self):
+        with patch.multiple(
+            "evennia.server.server", ServerConfig=DEFAULT, importlib=DEFAULT
+        ) as mocks:
+            mocks["ServerConfig"].objects.conf = MagicMock(return_value="done")
+            evennia = self.server.Evennia(MagicMock())
+            evennia.run_initial_setup()
+            mocks["importlib"].import_module.assert_not_called()
+
+    @override_settings(
+        CONN_MAX_AGE=600,
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "test.db3"},
+            "network": {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": "evennia",
+                "CONN_MAX_AGE": 0,
+                "CONN_HEALTH_CHECKS": False,
+            },
+        },
+    )
+    @patch("evennia.server.server.logger")
+    def test_db_connection_prep(self, mocklogger):
+        from django.conf import settings
+
+        self.server.Evennia.db_connection_prep(MagicMock())
+        self.assertEqual(
+            settings.DATABASES["default"],
+            {"ENGINE": "django.db.backends.sqlite3", "NAME": "test.db3"},
+        )
+        self.assertEqual(settings.DATABASES["network"]["CONN_MAX_AGE"], settings.CONN_MAX_AGE)
+        self.assertTrue(settings.DATABASES["network"]["CONN_HEALTH_CHECKS"])
+        self.assertEqual(mocklogger.log_warn.call_count, 2)
+
+    def _sigint_server(self, pending_requests):
+        evennia = self.server.Evennia(MagicMock())
+        evennia.shutdown = MagicMock()
+        evennia.web_root = MagicMock()
+        evennia.web_root.empty_threadpool = MagicMock(return_value=pending_requests)
+        return evennia
+
+    def test_sigint_no_pending_web_requests(self):
+        clock = Clock()
+        clock.stop = MagicMock()
+        with patch("evennia.server.server.reactor", new=clock):
+            evennia = self._sigint_server(succeed(None))
+            clock.sigInt()
+            # the shutdown is not run from inside the signal handler
+            evennia.shutdown.assert_not_called()
+            clock.advance(0)
+            evennia.shutdown.assert_called_once_with("reload", _reactor_stopping=True)
+            clock.stop.assert_called_once()
+
+    def test_sigint_pending_web_requests_timeout(self):
+        clock = Clock()
+        clock.stop = MagicMock()
+        with patch("evennia.server.server.reactor", new=clock):
+            evennia = self._sigint_server(Deferred())
+            clock.sigInt()
+            clock.advance(0)
+            # still waiting for the web requests
+            evennia.shutdown.assert_not_called()
+            clock.advance(self.server._SHUTDOWN_WEB_REQUEST_TIMEOUT)
+            clock.advance(0)
+            evennia.shutdown.assert_called_once_with("reload", _reactor_stopping=True)
+            clock.stop.assert_called_once()
+
     @patch("evennia.server.server.INFO_DICT", {"test": "foo"})
     def test_get_info_dict(self):
         evennia = self.server.Evennia(MagicMock())
@@ -300,7 +300,12 @@ DATABASES = {
 }
 # How long the django-database connection should be kept open, in seconds.
 # If you get errors about the database having gone away after long idle
-# periods, shorten this value (e.g. MySQL defaults to a timeout of 8 hrs)
+# periods, shorten this value (e.g. MySQL defaults to a timeout of 8 hrs).
+# This is applied at server start to all non-sqlite3 databases in DATABASES
+# that don't set their own CONN_MAX_AGE. These databases also always get
+# CONN_HEALTH_CHECKS turned on, so connections that timed out are re-opened
+# automatically. For multi-process deployments, a pooling database backend
+# such as django-db-connection-pool is recommended.
 CONN_MAX_AGE = 3600 * 7
 # When removing or renaming models, such models stored in Attributes may
 # become orphaned and will return as None. If the change is a rename (that